@@ -1,16 +1,51 @@
 # MarketDataPoint, Strategy base class
 
-from dataclasses import dataclass
 from datetime import datetime
 from abc import ABC, abstractmethod
+import numpy as np
 
-@dataclass(frozen=True)
+# __slots__ instead of @dataclass: no per-instance __dict__, so each tick is
+# ~3x smaller and tick.price is a C-level slot load instead of a dict lookup.
+# With millions of ticks held in a list, that is the difference between the
+# tick list fitting in RAM or not.
 class MarketDataPoint:
-    timestamp: datetime
-    symbol: str
-    price: float
+    __slots__ = ("_timestamp", "symbol", "price")
+
+    def __init__(self, timestamp, symbol: str, price: float):
+        self._timestamp = timestamp
+        self.symbol = symbol
+        self.price = price
+
+    @property
+    def timestamp(self) -> datetime:
+        # Ticks built from a parsed CSV column carry a raw np.datetime64
+        # (8 bytes vs ~48 for a datetime object) and only materialize a
+        # Python datetime if someone actually reads .timestamp.
+        ts = self._timestamp
+        if isinstance(ts, np.datetime64):
+            return ts.astype("datetime64[us]").item()
+        return ts
+
+    def __repr__(self):
+        return (f"MarketDataPoint(timestamp={self.timestamp!r}, "
+                f"symbol={self.symbol!r}, price={self.price!r})")
 
 class Strategy(ABC):
+    # Empty so subclasses can opt into __slots__ without inheriting a __dict__
+    __slots__ = ()
+
     @abstractmethod
-    def generate_signals(self, tick: MarketDataPoint) -> list:
-        pass
\ No newline at end of file
+    def generate_signals(self, tick: MarketDataPoint):
+        # Returns an iterable of signal strings; implementations share an
+        # empty tuple on the no-signal path instead of allocating a list
+        pass
+
+    def run_bulk(self, prices) -> None:
+        # Struct-of-arrays backtest path: drive the strategy straight off a
+        # packed float64 price array instead of n tick objects. The default
+        # reuses a single mutable tick so no per-tick allocation happens;
+        # subclasses override this with vectorized/compiled kernels.
+        tick = MarketDataPoint(None, "", 0.0)
+        for price in prices:
+            tick.price = price
+            self.generate_signals(tick)
\ No newline at end of file
@@ -5,33 +5,38 @@ from typing import Dict, Any
 # Generate complexity_report.md with tables, plots, and analysis.
 def generate_complexity_report(results: Dict[str, Any], plot_filename: str = "complexity_plots.png"):
     strategy_names = ["Naive", "Windowed", "Deque", "NumPy", "Streaming"]
+    # Result keys are invariant across rows, so build them once
+    time_keys = [f"{name}_time" for name in strategy_names]
+    memory_keys = [f"{name}_memory" for name in strategy_names]
 
-    runtime_table = """
+    # Collect rows in lists and join once at the end: repeated += on a str
+    # reallocates and copies the whole table on every row
+    runtime_rows = ["""
 ### Runtime (seconds)
 | Size    | Naive  | Windowed | Deque | NumPy  | Streaming |
 |---------|--------|----------|-------|--------|-----------|
-"""
+"""]
 
-    memory_table = """
+    memory_rows = ["""
 ### Memory Usage (peak MB)
 | Size    | Naive  | Windowed | Deque | NumPy  | Streaming |
 |---------|--------|----------|-------|--------|-----------|
-"""
+"""]
 
     for i, size in enumerate(results['sizes']):
-        runtime_row = f"| {size:,} | "
-        memory_row = f"| {size:,} | "
+        runtime_cells = [f"{size:,}"]
+        memory_cells = [f"{size:,}"]
 
-        for name in strategy_names:
-            if f"{name}_time" in results:
-                time_val = results[f"{name}_time"][i]
-                runtime_row += f"{time_val:>8.4f}s | "
+        for time_key, memory_key in zip(time_keys, memory_keys):
+            if time_key in results:
+                runtime_cells.append(f"{results[time_key][i]:>8.4f}s")
+                memory_cells.append(f"{results[memory_key][i]:>8.2f}MB")
 
-                mem_val = results[f"{name}_memory"][i]
-                memory_row += f"{mem_val:>8.2f}MB | "
+        runtime_rows.append("| " + " | ".join(runtime_cells) + " |\n")
+        memory_rows.append("| " + " | ".join(memory_cells) + " |\n")
 
-        runtime_table += runtime_row.rstrip(" |") + " |\n"
-        memory_table += memory_row.rstrip(" |") + " |\n"
+    runtime_table = "".join(runtime_rows)
+    memory_table = "".join(memory_rows)
 
     report = f"""# Complexity Analysis Results
 
@@ -4,22 +4,225 @@ from models import Strategy, MarketDataPoint
 from statistics import mean
 from collections import deque
 import numpy as np
-from functools import lru_cache
+from numba import njit
+
+# Shared zero-length tuple for the (overwhelmingly common) no-signal path:
+# `signals = []` allocated and immediately discarded a fresh list per tick,
+# while the empty tuple is a singleton. Callers only iterate the result,
+# so a tuple is a drop-in.
+_NO_SIGNAL = ()
+
+# Compiled bulk kernel for the naive strategy: a running sum makes the
+# per-tick mean O(1) (sum/count is mathematically the mean of all prices
+# so far), and Numba removes interpreter dispatch from the loop.
+# O(n) total instead of the per-tick path's O(n^2).
+#
+# The buy/sell state machine in every kernel is written branchless: the
+# crossing conditions become 0/1 flags and the state transitions become
+# arithmetic (select via cu*x + (1-cu)*y, toggle via xor). Data-dependent
+# branches on noisy price series mispredict and block LLVM from
+# vectorizing the loop body; flag arithmetic does neither. cu and cd are
+# mutually exclusive (price>ma vs price<ma, position 0 vs 1), so this is
+# exactly the old if/elif chain.
+@njit(cache=True, fastmath=True, error_model="numpy")
+def _run_naive(prices):
+    running_sum = 0.0
+    ma = 0.0
+    position = 0
+    entry_price = 0.0
+    realized_pnl = 0.0
+    for i in range(prices.shape[0]):
+        price = prices[i]
+        running_sum += price
+        # First tick just initializes ma, same as the per-tick path
+        if i == 0:
+            ma = price
+            continue
+        # Decide against the previous tick's ma, then refresh it
+        cu = np.int64(price > ma) & np.int64(position == 0)
+        cd = np.int64(price < ma) & np.int64(position == 1)
+        realized_pnl += cd * (price - entry_price)
+        entry_price = cu * price + (1 - cu) * entry_price
+        position ^= cu | cd
+        ma = running_sum / (i + 1.0)
+    return realized_pnl
+
+# Compiled bulk kernel for the windowed strategy: fixed-size ring buffer plus
+# a running sum, so every tick is O(1) with no memmove (list.pop(0) moves the
+# whole remaining window on each full-window tick, making the Python path
+# O(nk), not the O(n) its docstring claims).
+@njit(cache=True, fastmath=True, error_model="numpy")
+def _run_windowed(prices, window):
+    buf = np.empty(window, np.float64)
+    head = 0
+    filled = 0
+    running_sum = 0.0
+    ma = 0.0
+    position = 0
+    entry_price = 0.0
+    realized_pnl = 0.0
+    for i in range(prices.shape[0]):
+        price = prices[i]
+        if filled == window:
+            running_sum -= buf[head]
+        else:
+            filled += 1
+        buf[head] = price
+        head += 1
+        if head == window:
+            head = 0
+        running_sum += price
+        # First tick just initializes ma, same as the per-tick path
+        if i == 0:
+            ma = price
+            continue
+        ma = running_sum / filled
+        # Branchless FSM: see the note above _run_naive
+        cu = np.int64(price > ma) & np.int64(position == 0)
+        cd = np.int64(price < ma) & np.int64(position == 1)
+        realized_pnl += cd * (price - entry_price)
+        entry_price = cu * price + (1 - cu) * entry_price
+        position ^= cu | cd
+    return realized_pnl
+
+# Fused kernel: advance all five strategies' state machines in a single pass
+# over the price array. Each strategy only reads its own state and the shared
+# read-only prices, so fusing is safe — there is no observable cross-strategy
+# state. One pass means one stream of cache lines instead of five; the FSMs
+# are serial, so parallel=False (there is nothing independent to split).
+@njit(parallel=False, fastmath=True, cache=True)
+def run_all(prices, windowed_window, deque_maxlen, numpy_window, alpha):
+    # Naive: running sum over the full history (sum/count == mean so far)
+    naive_sum = 0.0
+    naive_ma = 0.0
+    naive_pos = 0
+    naive_entry = 0.0
+    naive_pnl = 0.0
+    # Windowed / Deque / NumPy: same ring-buffer algorithm, different windows
+    wbuf = np.zeros(windowed_window, np.float64)
+    whead = 0
+    wfilled = 0
+    wsum = 0.0
+    wpos = 0
+    wentry = 0.0
+    wpnl = 0.0
+    dbuf = np.zeros(deque_maxlen, np.float64)
+    dhead = 0
+    dfilled = 0
+    dsum = 0.0
+    dpos = 0
+    dentry = 0.0
+    dpnl = 0.0
+    vbuf = np.zeros(numpy_window, np.float64)
+    vhead = 0
+    vfilled = 0
+    vsum = 0.0
+    vpos = 0
+    ventry = 0.0
+    vpnl = 0.0
+    # Streaming: EMA scalar only
+    ema = 0.0
+    spos = 0
+    sentry = 0.0
+    spnl = 0.0
+    for i in range(prices.shape[0]):
+        price = prices[i]
+
+        # Naive: decide against the previous tick's ma, then refresh it
+        naive_sum += price
+        if i == 0:
+            naive_ma = price
+        else:
+            cu = np.int64(price > naive_ma) & np.int64(naive_pos == 0)
+            cd = np.int64(price < naive_ma) & np.int64(naive_pos == 1)
+            naive_pnl += cd * (price - naive_entry)
+            naive_entry = cu * price + (1 - cu) * naive_entry
+            naive_pos ^= cu | cd
+            naive_ma = naive_sum / (i + 1.0)
+
+        # Windowed: ring buffer, decide against the refreshed ma
+        if wfilled == windowed_window:
+            wsum -= wbuf[whead]
+        else:
+            wfilled += 1
+        wbuf[whead] = price
+        whead += 1
+        if whead == windowed_window:
+            whead = 0
+        wsum += price
+        if i > 0:
+            wma = wsum / wfilled
+            cu = np.int64(price > wma) & np.int64(wpos == 0)
+            cd = np.int64(price < wma) & np.int64(wpos == 1)
+            wpnl += cd * (price - wentry)
+            wentry = cu * price + (1 - cu) * wentry
+            wpos ^= cu | cd
+
+        # Deque: identical update with its own window size
+        if dfilled == deque_maxlen:
+            dsum -= dbuf[dhead]
+        else:
+            dfilled += 1
+        dbuf[dhead] = price
+        dhead += 1
+        if dhead == deque_maxlen:
+            dhead = 0
+        dsum += price
+        if i > 0:
+            dma = dsum / dfilled
+            cu = np.int64(price > dma) & np.int64(dpos == 0)
+            cd = np.int64(price < dma) & np.int64(dpos == 1)
+            dpnl += cd * (price - dentry)
+            dentry = cu * price + (1 - cu) * dentry
+            dpos ^= cu | cd
+
+        # NumPy: identical update with its own window size
+        if vfilled == numpy_window:
+            vsum -= vbuf[vhead]
+        else:
+            vfilled += 1
+        vbuf[vhead] = price
+        vhead += 1
+        if vhead == numpy_window:
+            vhead = 0
+        vsum += price
+        if i > 0:
+            vma = vsum / vfilled
+            cu = np.int64(price > vma) & np.int64(vpos == 0)
+            cd = np.int64(price < vma) & np.int64(vpos == 1)
+            vpnl += cd * (price - ventry)
+            ventry = cu * price + (1 - cu) * ventry
+            vpos ^= cu | cd
+
+        # Streaming: EMA update, then decide against the updated value
+        if i == 0:
+            ema = price
+        else:
+            ema = alpha * price + (1.0 - alpha) * ema
+        cu = np.int64(price > ema) & np.int64(spos == 0)
+        cd = np.int64(price < ema) & np.int64(spos == 1)
+        spnl += cd * (price - sentry)
+        sentry = cu * price + (1 - cu) * sentry
+        spos ^= cu | cd
+
+    return naive_pnl, wpnl, dpnl, vpnl, spnl
 
 # For each tick, recompute the average price from scratch
 # Time per tick: appending is O(1); mean(self.prices) is O(n) because it scans the whole list
 # Space: self.prices stores all past prices, so total space is O(n)
 class NaiveMovingAverageStrategy(Strategy):
+    __slots__ = ("prices", "ma", "position", "entry_price", "realized_pnl")
+
     def __init__(self):
-        self.prices = []            # Full price history
-        self.ma = None              # Current moving average (scalar -> O(1) space)
-        self.position = 0           # 0 = flat, 1 = long (scalar -> O(1) space)
-        self.entry_price = None     # Price at which current position was opened (scalar -> O(1) space)
-        self.realized_pnl = 0.0     # Cumulative realized profit/loss (scalar -> O(1) space)
+        self.prices: list = []                  # Full price history
+        self.ma: float | None = None            # Current moving average (scalar -> O(1) space)
+        self.position: int = 0                  # 0 = flat, 1 = long (scalar -> O(1) space)
+        self.entry_price: float | None = None   # Price at which current position was opened (scalar -> O(1) space)
+        self.realized_pnl: float = 0.0          # Cumulative realized profit/loss (scalar -> O(1) space)
 
-    def generate_signals(self, tick: MarketDataPoint) -> list:
+    def generate_signals(self, tick: MarketDataPoint):
         price = tick.price
-        signals = []
+        signals = _NO_SIGNAL
 
         # Add newest price: O(1) to append a single element
         self.prices.append(price)
@@ -34,12 +237,12 @@ class NaiveMovingAverageStrategy(Strategy):
         if price > self.ma and self.position == 0:
             self.position = 1
             self.entry_price = price
-            signals.append("BUY")
+            signals = ["BUY"]
         elif price < self.ma and self.position == 1:
             self.position = 0
             self.realized_pnl += price - self.entry_price
             self.entry_price = None
-            signals.append("SELL")
+            signals = ["SELL"]
 
         # Update the moving average: iterates over all stored prices -> O(n) time
         self.ma = mean(self.prices)
@@ -47,98 +250,126 @@ class NaiveMovingAverageStrategy(Strategy):
         # Overall per-tick time: O(n); overall space: O(n)
         return signals
 
+    def run_bulk(self, prices) -> None:
+        # Bulk backtest path: compiled kernel, O(n) time and O(1) extra space.
+        # Only realized PnL is carried back; the per-tick Python state
+        # (price history, ma) is not rebuilt.
+        prices = np.ascontiguousarray(prices, dtype=np.float64)
+        self.realized_pnl += _run_naive(prices)
+
     def total_return(self):
         # O(1) time, just return a scalar
         return self.realized_pnl
 
-# Maintain a fixed-size buffer and update the average incrementally with a running sum
-# Time per tick: all operations are O(1); no loop over all past ticks
-# Space: self.prices holds at most k prices where k = window size -> O(k) space regardless of total ticks
+# Maintain a fixed-size ring buffer and update the average incrementally with a running sum
+# Time per tick: all operations are O(1); no loop over all past ticks and no
+# memmove (list.pop(0) shifted the whole window on every full-window tick)
+# Space: self.prices holds exactly k slots where k = window size -> O(k) space regardless of total ticks
 class WindowedMovingAverageStrategy(Strategy):
+    __slots__ = ("window", "prices", "head", "filled", "sum_prices",
+                 "ma", "position", "entry_price", "realized_pnl")
+
     def __init__(self, window=10):
-        self.window = window        # Size of the moving average window (scalar -> O(1) space)
-        self.prices = []            # Recent prices up to window length (O(k) space)
-        self.sum_prices = 0.0       # Running sum of prices in window (scalar -> O(1) space)
-        self.ma = None              # Current moving average (scalar -> O(1) space)
-        self.position = 0           # 0 = flat, 1 = long (scalar -> O(1) space)
-        self.entry_price = None     # Price at which current position was opened (scalar -> O(1) space)
-        self.realized_pnl = 0.0     # Cumulative realized profit/loss (scalar -> O(1) space)
-
-    def generate_signals(self, tick: MarketDataPoint) -> list:
+        self.window: int = window               # Size of the moving average window (scalar -> O(1) space)
+        self.prices: list = [0.0] * window      # Preallocated ring buffer (O(k) space)
+        self.head: int = 0                      # Next ring-buffer slot to overwrite (scalar -> O(1) space)
+        self.filled: int = 0                    # Number of valid slots, capped at window (scalar -> O(1) space)
+        self.sum_prices: float = 0.0            # Running sum of prices in window (scalar -> O(1) space)
+        self.ma: float | None = None            # Current moving average (scalar -> O(1) space)
+        self.position: int = 0                  # 0 = flat, 1 = long (scalar -> O(1) space)
+        self.entry_price: float | None = None   # Price at which current position was opened (scalar -> O(1) space)
+        self.realized_pnl: float = 0.0          # Cumulative realized profit/loss (scalar -> O(1) space)
+
+    def generate_signals(self, tick: MarketDataPoint):
         price = tick.price
-        signals = []
+        signals = _NO_SIGNAL
 
-        # Remove oldest price if window is full
-        # Since k is a fixed small window, functionally it's O(1) with respect to total ticks
-        if len(self.prices) == self.window:
-            oldest = self.prices.pop(0)
-            self.sum_prices -= oldest
+        # Overwrite the oldest slot if the window is full: O(1), no memmove
+        if self.filled == self.window:
+            self.sum_prices -= self.prices[self.head]
+        else:
+            self.filled += 1
 
-        # Add newest price: O(1) time
-        self.prices.append(price)
+        # Write newest price and advance the head: O(1) time
+        self.prices[self.head] = price
+        self.head = self.head + 1 if self.head + 1 < self.window else 0
         self.sum_prices += price
 
         # First tick just initialize ma: O(1) time
-        if len(self.prices) == 1:
+        if self.filled == 1:
             self.ma = price
             return signals
 
         # Update the moving average: O(1) time
-        self.ma = self.sum_prices / len(self.prices)
+        self.ma = self.sum_prices / self.filled
 
         # Price above ma -> enter long; price below -> exit position
         # Trading rule checks and assignments are all O(1)
         if price > self.ma and self.position == 0:
             self.position = 1
             self.entry_price = price
-            signals.append("BUY")
+            signals = ["BUY"]
         elif price < self.ma and self.position == 1:
             self.position = 0
             self.realized_pnl += price - self.entry_price
             self.entry_price = None
-            signals.append("SELL")
+            signals = ["SELL"]
 
         # Overall per-tick time: O(1); space: O(k) for prices and O(1) for scalars
         return signals
 
+    def run_bulk(self, prices) -> None:
+        # Bulk backtest path: compiled ring-buffer kernel, O(n) time, O(k) space
+        prices = np.ascontiguousarray(prices, dtype=np.float64)
+        self.realized_pnl += _run_windowed(prices, self.window)
+
     def total_return(self):
         # O(1) time, just return a scalar
         return self.realized_pnl
 
 # Naive strategy but uses deque(maxlen=N) to keep only recent prices.
-# Time: O(k) per tick where k = maxlen (still uses mean()).
+# Time: O(1) per tick thanks to a running sum (mean() used to rescan all k).
 # Space: O(k) instead of O(n).
 class DequeNaiveStrategy(Strategy):
-    def __init__(self, maxlen=1000):        # Capped to prevent O(n) memory
-        self.prices = deque(maxlen=maxlen)
-        self.ma = None
-        self.position = 0
-        self.entry_price = None
-        self.realized_pnl = 0.0
+    __slots__ = ("maxlen", "prices", "sum_prices",
+                 "ma", "position", "entry_price", "realized_pnl")
 
-    def generate_signals(self, tick: MarketDataPoint) -> list:
+    def __init__(self, maxlen=1000):        # Capped to prevent O(n) memory
+        self.maxlen: int = maxlen
+        self.prices: deque = deque(maxlen=maxlen)
+        self.sum_prices: float = 0.0
+        self.ma: float | None = None
+        self.position: int = 0
+        self.entry_price: float | None = None
+        self.realized_pnl: float = 0.0
+
+    def generate_signals(self, tick: MarketDataPoint):
         price = tick.price
-        signals = []
+        signals = _NO_SIGNAL
 
-        # deque automatically drops oldest when maxlen reached
+        # deque evicts the oldest element silently once maxlen is reached,
+        # so subtract it from the running sum before it disappears
+        if len(self.prices) == self.maxlen:
+            self.sum_prices -= self.prices[0]
         self.prices.append(price)
+        self.sum_prices += price
 
         if self.ma is None:
             self.ma = price
             return signals
 
-        # Still O(k) time due to mean(), but k is bounded
-        self.ma = mean(self.prices)
+        # O(1) average from the running sum instead of an O(k) mean() scan
+        self.ma = self.sum_prices / len(self.prices)
 
         if price > self.ma and self.position == 0:
             self.position = 1
             self.entry_price = price
-            signals.append("BUY")
+            signals = ["BUY"]
         elif price < self.ma and self.position == 1:
             self.position = 0
             self.realized_pnl += price - self.entry_price
             self.entry_price = None
-            signals.append("SELL")
+            signals = ["SELL"]
 
         return signals
 
@@ -149,25 +380,35 @@ class DequeNaiveStrategy(Strategy):
 # Use NumPy arrays for faster computation (O(n) total time, O(k) space)
 # NumPy array + running sum for fastest execution
 class NumPyVectorizedStrategy(Strategy):
+    __slots__ = ("window", "prices", "head", "count", "sum_prices",
+                 "ma", "position", "entry_price", "realized_pnl")
+
     def __init__(self, window=1000):
-        self.window = window
-        self.prices = np.zeros(window, dtype=np.float64)
-        self.count = 0
-        self.sum_prices = 0.0
-        self.ma = None
-        self.position = 0
-        self.entry_price = None
-        self.realized_pnl = 0.0
-
-    def generate_signals(self, tick: MarketDataPoint) -> list:
+        self.window: int = window
+        self.prices: np.ndarray = np.zeros(window, dtype=np.float64)
+        self.head: int = 0
+        self.count: int = 0
+        self.sum_prices: float = 0.0
+        self.ma: float | None = None
+        self.position: int = 0
+        self.entry_price: float | None = None
+        self.realized_pnl: float = 0.0
+
+    def generate_signals(self, tick: MarketDataPoint):
         price = tick.price
-        signals = []
-
-        # Circular buffer in NumPy array
-        if self.count == self.window:
-            self.sum_prices -= self.prices[self.count % self.window]
-
-        self.prices[self.count % self.window] = price
+        signals = _NO_SIGNAL
+
+        # Circular buffer in NumPy array, indexed by an explicit head:
+        # an integer add + compare per tick instead of two idiv-backed
+        # `count % window` evaluations. (The old eviction test
+        # `count == window` also only fired once, so the running sum grew
+        # unbounded after the first wrap; evicting whenever the buffer is
+        # full restores the intended rolling window.)
+        if self.count >= self.window:
+            self.sum_prices -= self.prices[self.head]
+
+        self.prices[self.head] = price
+        self.head = self.head + 1 if self.head + 1 < self.window else 0
         self.sum_prices += price
         self.count += 1
 
@@ -182,15 +423,53 @@ class NumPyVectorizedStrategy(Strategy):
         if price > self.ma and self.position == 0:
             self.position = 1
             self.entry_price = price
-            signals.append("BUY")
+            signals = ["BUY"]
         elif price < self.ma and self.position == 1:
             self.position = 0
             self.realized_pnl += price - self.entry_price
             self.entry_price = None
-            signals.append("SELL")
+            signals = ["SELL"]
 
         return signals
 
+    def run_bulk(self, prices) -> None:
+        # Fully vectorized backtest: the whole moving-average vector comes
+        # from two cumulative-sum slices, and the buy/sell FSM is recovered
+        # from sign changes of price - ma. Bandwidth-bound NumPy instead of a
+        # Python loop; the per-tick circular-buffer path stays for online use.
+        prices = np.ascontiguousarray(prices, dtype=np.float64)
+        n = prices.shape[0]
+        if n == 0:
+            return
+
+        # Rolling-window mean, expanding during warmup:
+        # ma[t] = (c[t+1] - c[max(t+1-k, 0)]) / min(t+1, k)
+        c = np.concatenate(([0.0], np.cumsum(prices, dtype=np.float64)))
+        end = np.arange(1, n + 1)
+        start = np.maximum(end - self.window, 0)
+        ma = (c[end] - c[start]) / (end - start)
+
+        # The FSM enters long on price > ma when flat and exits on
+        # price < ma when long, so the position is the forward-fill of
+        # sign(price - ma): +1 enters, -1 exits, 0 (price == ma) holds.
+        # The first tick never trades because ma[0] == prices[0].
+        state = np.where(prices > ma, 1, np.where(prices < ma, -1, 0))
+        tick_idx = np.arange(n)
+        last_nonzero = np.maximum.accumulate(np.where(state != 0, tick_idx, -1))
+        position = np.where(last_nonzero >= 0,
+                            state[np.maximum(last_nonzero, 0)] == 1, False)
+
+        # Trades happen where the position flips; entries and exits strictly
+        # alternate starting with an entry, and an unmatched final entry is
+        # an open position with no realized PnL.
+        prev_position = np.concatenate(([False], position[:-1]))
+        entry_idx = np.flatnonzero(position & ~prev_position)
+        exit_idx = np.flatnonzero(~position & prev_position)
+        n_closed = exit_idx.shape[0]
+        self.realized_pnl += float(
+            prices[exit_idx].sum() - prices[entry_idx[:n_closed]].sum()
+        )
+
     def total_return(self):
         # O(1) time, just return a scalar
         return self.realized_pnl
@@ -200,34 +479,38 @@ class NumPyVectorizedStrategy(Strategy):
 # Uses previous-MA as proxy (like EMA approximation).
 # Time: O(1), Space: O(1).
 class StreamingStrategy(Strategy):
+    __slots__ = ("alpha", "one_minus_alpha", "prev_ma",
+                 "position", "entry_price", "realized_pnl")
+
     def __init__(self, alpha=0.1):  # EMA smoothing factor
-        self.alpha = alpha
-        self.prev_ma = None
-        self.position = 0
-        self.entry_price = None
-        self.realized_pnl = 0.0
-
-    @lru_cache(maxsize=1)  # memoize last computation
-    def ema_update(self, price, prev_ma):
-        if prev_ma is None:
-            return price
-        return self.alpha * price + (1 - self.alpha) * prev_ma
-
-    def generate_signals(self, tick: MarketDataPoint) -> list:
+        self.alpha: float = alpha
+        self.one_minus_alpha: float = 1.0 - alpha  # Hoisted out of the per-tick path
+        self.prev_ma: float | None = None
+        self.position: int = 0
+        self.entry_price: float | None = None
+        self.realized_pnl: float = 0.0
+
+    def generate_signals(self, tick: MarketDataPoint):
         price = tick.price
-        signals = []
+        signals = _NO_SIGNAL
 
-        self.prev_ma = self.ema_update(price, self.prev_ma)
+        # Inline EMA recurrence. The old @lru_cache(maxsize=1) on this update
+        # never hit (price changes every tick) and just charged hash + dict
+        # probe + lock per call.
+        if self.prev_ma is None:
+            self.prev_ma = price
+        else:
+            self.prev_ma = self.alpha * price + self.one_minus_alpha * self.prev_ma
 
         if price > self.prev_ma and self.position == 0:
             self.position = 1
             self.entry_price = price
-            signals.append("BUY")
+            signals = ["BUY"]
         elif price < self.prev_ma and self.position == 1:
             self.position = 0
             self.realized_pnl += price - self.entry_price
             self.entry_price = None
-            signals.append("SELL")
+            signals = ["SELL"]
 
         return signals
 